@@ -1,3 +1,5 @@
+import os
+
 import click
 import uvicorn
 
@@ -5,14 +7,33 @@ import uvicorn
 @click.command()
 @click.option("--host", default="0.0.0.0", help="Host to run the server on")
 @click.option("--port", default=8000, help="Port to run the server on")
-@click.option("--reload", is_flag=False, help="Reload the server on code changes")
-def main(host: str, port: int, reload: bool):
+@click.option("--reload", is_flag=True, help="Reload the server on code changes")
+@click.option("--access-log", is_flag=True, help="Enable the per-request access log")
+@click.option(
+    "--workers",
+    default=None,
+    type=click.IntRange(min=1),
+    envvar="WEB_CONCURRENCY",
+    help="Number of worker processes (defaults to the usable CPUs, ignored with --reload)",
+)
+def main(host: str, port: int, reload: bool, access_log: bool, workers: int | None):
     """Entry point for the application script."""
+    # Uvicorn does not support reloading with multiple workers.
+    if reload:
+        workers = None
+    elif workers is None:
+        workers = os.process_cpu_count()
+
     uvicorn.run(
         "fastapi_template.main:app",
         host=host,
         port=port,
         reload=reload,
+        workers=workers,
+        # Use uvloop wherever it is installed, and the stdlib loop elsewhere.
+        loop="auto",
+        http="httptools",
+        access_log=access_log,
     )
 
 
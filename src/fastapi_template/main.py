@@ -1,25 +1,44 @@
-from fastapi import FastAPI
+from fastapi import FastAPI, Response
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
+
+from fastapi_template.settings import FrozenSettings, settings
+
+# The root response never changes, so encode it once at import time.
+_OK_BYTES = b'{"status":"ok"}'
+
+
+def _build_servers(cfg: FrozenSettings) -> list[dict[str, str]]:
+    """
+    Build the OpenAPI servers list for the given settings.
+    """
+    servers = []
+    # If the python environment is not production, add the local server.
+    if cfg.python_env != "production":
+        servers.append({"url": "http://localhost:8000", "description": "Local"})
+    servers.append(
+        {
+            "url": f"https://{cfg.fastapi_template_domain}",
+            "description": "Production",
+        }
+    )
+    return servers
+
+
+def _configure_compression(target_app: FastAPI, cfg: FrozenSettings) -> None:
+    """
+    Add response compression to the app, unless disabled in the settings.
+    """
+    if cfg.fastapi_template_gzip_enabled:
+        target_app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
 
-from fastapi_template.settings import settings
 
 app = FastAPI(
     title="FastAPI Template",
     description="A template for a FastAPI project.",
     version="0.0.0",
-    servers=[
-        server
-        for server in [
-            {"url": "http://localhost:8000", "description": "Local"}
-            # If the python environment is not production, add the local server.
-            if settings.python_env != "production"
-            else None,
-            {
-                "url": f"https://{settings.fastapi_template_domain}",
-                "description": "Production",
-            },
-        ]
-        if server is not None
-    ],
+    default_response_class=ORJSONResponse,
+    servers=_build_servers(settings),
     license_info={
         "name": "MIT",
         "identifier": "MIT",
@@ -32,7 +51,9 @@ app = FastAPI(
     },
 )
 
+_configure_compression(app, settings)
+
 
 @app.get("/")
-async def root():
-    return {"status": "ok"}
+async def root() -> Response:
+    return Response(_OK_BYTES, media_type="application/json")
@@ -1,4 +1,4 @@
-from functools import lru_cache
+from typing import NamedTuple
 
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -10,13 +10,27 @@ class Settings(BaseSettings):
 
     python_env: str | None = "production"
     fastapi_template_domain: str
+    fastapi_template_gzip_enabled: bool = True
 
-    model_config: SettingsConfigDict = SettingsConfigDict(env_file=".env")
+    # Treat empty values (e.g. `PYTHON_ENV=` from .env.example) as unset.
+    model_config: SettingsConfigDict = SettingsConfigDict(
+        env_file=".env", env_ignore_empty=True
+    )
 
 
-@lru_cache
-def get_settings():
-    return Settings()
+class FrozenSettings(NamedTuple):
+    """
+    Immutable snapshot of the validated settings.
+    """
+
+    python_env: str | None
+    fastapi_template_domain: str
+    fastapi_template_gzip_enabled: bool
+
+
+# Validate the environment once at import, then keep only the plain values.
+settings = FrozenSettings(**Settings().model_dump())
 
 
-settings = get_settings()
+def get_settings() -> FrozenSettings:
+    return settings
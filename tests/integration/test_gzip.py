@@ -0,0 +1,51 @@
+import pytest
+from fastapi import FastAPI, Response
+from fastapi.testclient import TestClient
+
+from src.fastapi_template.main import _configure_compression
+from src.fastapi_template.settings import FrozenSettings
+
+
+def _make_client(gzip_enabled: bool) -> TestClient:
+    settings = FrozenSettings(
+        python_env="production",
+        fastapi_template_domain="example.com",
+        fastapi_template_gzip_enabled=gzip_enabled,
+    )
+    app = FastAPI()
+    _configure_compression(app, settings)
+
+    @app.get("/small")
+    async def small():
+        return Response(b"x" * 16, media_type="text/plain")
+
+    @app.get("/large")
+    async def large():
+        return Response(b"x" * 2048, media_type="text/plain")
+
+    return TestClient(app)
+
+
+@pytest.mark.integration
+def test_large_response_is_compressed():
+    client = _make_client(gzip_enabled=True)
+    response = client.get("/large", headers={"Accept-Encoding": "gzip"})
+    assert response.status_code == 200
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.content == b"x" * 2048
+
+
+@pytest.mark.integration
+def test_small_response_is_not_compressed():
+    client = _make_client(gzip_enabled=True)
+    response = client.get("/small", headers={"Accept-Encoding": "gzip"})
+    assert response.status_code == 200
+    assert "content-encoding" not in response.headers
+
+
+@pytest.mark.integration
+def test_compression_can_be_disabled():
+    client = _make_client(gzip_enabled=False)
+    response = client.get("/large", headers={"Accept-Encoding": "gzip"})
+    assert response.status_code == 200
+    assert "content-encoding" not in response.headers
@@ -0,0 +1,85 @@
+import os
+
+import pytest
+from click.testing import CliRunner
+
+from src.fastapi_template import cli
+
+
+@pytest.fixture
+def run_calls(monkeypatch):
+    monkeypatch.delenv("WEB_CONCURRENCY", raising=False)
+    calls = []
+    monkeypatch.setattr(
+        cli.uvicorn, "run", lambda *args, **kwargs: calls.append(kwargs)
+    )
+    return calls
+
+
+@pytest.mark.unit
+def test_workers_default_to_process_cpu_count(run_calls):
+    result = CliRunner().invoke(cli.main, [])
+    assert result.exit_code == 0
+    assert run_calls[0]["workers"] == os.process_cpu_count()
+    assert run_calls[0]["reload"] is False
+
+
+@pytest.mark.unit
+def test_explicit_workers(run_calls):
+    result = CliRunner().invoke(cli.main, ["--workers", "4"])
+    assert result.exit_code == 0
+    assert run_calls[0]["workers"] == 4
+
+
+@pytest.mark.unit
+def test_workers_from_web_concurrency(run_calls):
+    result = CliRunner().invoke(cli.main, [], env={"WEB_CONCURRENCY": "2"})
+    assert result.exit_code == 0
+    assert run_calls[0]["workers"] == 2
+
+
+@pytest.mark.unit
+def test_explicit_workers_override_web_concurrency(run_calls):
+    result = CliRunner().invoke(
+        cli.main, ["--workers", "3"], env={"WEB_CONCURRENCY": "2"}
+    )
+    assert result.exit_code == 0
+    assert run_calls[0]["workers"] == 3
+
+
+@pytest.mark.unit
+def test_reload_runs_a_single_process(run_calls):
+    result = CliRunner().invoke(cli.main, ["--reload", "--workers", "4"])
+    assert result.exit_code == 0
+    assert run_calls[0]["reload"] is True
+    assert run_calls[0]["workers"] is None
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("workers", ["0", "-1"])
+def test_workers_must_be_positive(run_calls, workers):
+    result = CliRunner().invoke(cli.main, ["--workers", workers])
+    assert result.exit_code != 0
+    assert run_calls == []
+
+
+@pytest.mark.unit
+def test_server_uses_fast_loop_and_parser(run_calls):
+    result = CliRunner().invoke(cli.main, [])
+    assert result.exit_code == 0
+    assert run_calls[0]["loop"] == "auto"
+    assert run_calls[0]["http"] == "httptools"
+
+
+@pytest.mark.unit
+def test_access_log_is_off_by_default(run_calls):
+    result = CliRunner().invoke(cli.main, [])
+    assert result.exit_code == 0
+    assert run_calls[0]["access_log"] is False
+
+
+@pytest.mark.unit
+def test_access_log_can_be_enabled(run_calls):
+    result = CliRunner().invoke(cli.main, ["--access-log"])
+    assert result.exit_code == 0
+    assert run_calls[0]["access_log"] is True
@@ -0,0 +1,35 @@
+import pytest
+from fastapi.responses import ORJSONResponse
+
+from src.fastapi_template.main import _build_servers, app
+from src.fastapi_template.settings import FrozenSettings
+
+
+@pytest.mark.unit
+def test_build_servers_production():
+    settings = FrozenSettings(
+        python_env="production",
+        fastapi_template_domain="example.com",
+        fastapi_template_gzip_enabled=True,
+    )
+    assert _build_servers(settings) == [
+        {"url": "https://example.com", "description": "Production"},
+    ]
+
+
+@pytest.mark.unit
+def test_build_servers_development():
+    settings = FrozenSettings(
+        python_env="development",
+        fastapi_template_domain="example.com",
+        fastapi_template_gzip_enabled=True,
+    )
+    assert _build_servers(settings) == [
+        {"url": "http://localhost:8000", "description": "Local"},
+        {"url": "https://example.com", "description": "Production"},
+    ]
+
+
+@pytest.mark.unit
+def test_default_response_class_is_orjson():
+    assert app.router.default_response_class is ORJSONResponse
@@ -0,0 +1,41 @@
+import pytest
+
+from src.fastapi_template.settings import FrozenSettings, Settings, get_settings
+
+
+@pytest.mark.unit
+def test_get_settings_is_frozen():
+    settings = get_settings()
+    assert isinstance(settings, FrozenSettings)
+    with pytest.raises(AttributeError):
+        settings.python_env = "development"
+
+
+@pytest.mark.unit
+def test_frozen_settings_match_fields():
+    assert FrozenSettings._fields == tuple(Settings.model_fields)
+
+
+@pytest.mark.unit
+def test_empty_env_values_use_defaults(tmp_path, monkeypatch):
+    for name in ("PYTHON_ENV", "FASTAPI_TEMPLATE_GZIP_ENABLED"):
+        monkeypatch.delenv(name, raising=False)
+    env_file = tmp_path / ".env"
+    env_file.write_text(
+        "PYTHON_ENV=\nFASTAPI_TEMPLATE_DOMAIN=example.com\n"
+        "FASTAPI_TEMPLATE_GZIP_ENABLED=\n"
+    )
+
+    settings = Settings(_env_file=env_file)
+
+    assert settings.python_env == "production"
+    assert settings.fastapi_template_gzip_enabled is True
+
+
+@pytest.mark.unit
+def test_empty_environment_variable_uses_default(monkeypatch):
+    monkeypatch.setenv("FASTAPI_TEMPLATE_GZIP_ENABLED", "")
+
+    settings = Settings(_env_file=None, fastapi_template_domain="example.com")
+
+    assert settings.fastapi_template_gzip_enabled is True